@@ -0,0 +1,177 @@
+# cache.py
+
+import hashlib
+import re
+import struct
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Tags prefixed to stored vectors so both encodings can share the disk tier
+_FLOAT32_TAG = b'f'
+_INT8_TAG = b'q'
+
+# Fuzzy keys only fold variants that do not change the meaning of a query:
+# - typographic apostrophes (’ ‘) become plain ones
+# - common contractions are expanded ("what's" -> "what is", "don't" -> "do not")
+# - a trailing run of "?", "!" or "." at the end of the query is dropped
+# Symbols inside tokens ("c++", "c#", "1.5", "$5", "50%") are kept as they are.
+_APOSTROPHES = str.maketrans({'\u2019': "'", '\u2018': "'"})
+_CONTRACTIONS = (
+    (re.compile(r"\b(what|where|who|how|when|why|it|that|there|here)'s\b"), r"\1 is"),
+    (re.compile(r"\bcan't\b"), "can not"),
+    (re.compile(r"\bwon't\b"), "will not"),
+    (re.compile(r"n't\b"), " not"),
+    (re.compile(r"'re\b"), " are"),
+    (re.compile(r"'ve\b"), " have"),
+    (re.compile(r"'m\b"), " am"),
+    (re.compile(r"'ll\b"), " will")
+)
+_TRAILING_PUNCTUATION = re.compile(r"[?!.]+$")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Collapse newlines, tabs and repeated spaces into single spaces.
+    """
+    return " ".join(text.split())
+
+
+def fold_text(text: str) -> str:
+    """
+    Fold apostrophes, contractions and trailing punctuation of a lowercase text.
+    Texts made only of punctuation are returned unchanged.
+    """
+    folded = text.translate(_APOSTROPHES)
+    for pattern, replacement in _CONTRACTIONS:
+        folded = pattern.sub(replacement, folded)
+    folded = normalize_text(_TRAILING_PUNCTUATION.sub("", folded))
+    return folded or text
+
+
+class EmbeddingCache:
+    """
+    Thread-safe LRU cache for embeddings with an optional on-disk tier.
+
+    Vectors are stored as packed float32 values to halve memory compared to lists
+    of Python floats, or as int8 values with a per-vector scale (about 4x smaller
+    again) when `quantize` is enabled. The lock only guards dictionary operations,
+    so a miss never blocks other threads while the embedding is being computed.
+
+    With `fuzzy` enabled, keys also fold apostrophes, contractions and trailing
+    punctuation (see `fold_text`), so near-duplicate queries reuse one embedding.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        path: Optional[str] = None,
+        quantize: bool = False,
+        fuzzy: bool = False
+    ):
+        self.maxsize = maxsize
+        self.quantize = quantize
+        self.fuzzy = fuzzy
+        self._entries: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = self._initialize_disk_cache(path) if path else None
+
+    @staticmethod
+    def _initialize_disk_cache(path: str) -> Any:
+        """
+        Open the persistent cache tier backed by diskcache.
+        Raises ImportError if the 'diskcache' package is not installed.
+        """
+        try:
+            import diskcache
+        except ImportError as e:
+            raise ImportError(
+                "EMBED_CACHE_PATH is set but the 'diskcache' package is not installed.") from e
+        logger.info("Using persistent embedding cache at '%s'.", path)
+        return diskcache.Cache(path)
+
+    def make_key(self, model: str, text: str) -> bytes:
+        """
+        Build a 16-byte cache key from the model name and the normalized text.
+        """
+        text = normalize_text(text).lower()
+        if self.fuzzy:
+            text = fold_text(text)
+        payload = model.encode() + b"\0" + text.encode()
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[List[float]]:
+        """
+        Return the cached embedding for a key, or None on a miss.
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                return self._decode(data)
+
+        if self._disk is None:
+            return None
+        data = self._disk.get(key)
+        if data is None:
+            return None
+        self._store(key, data)
+        return self._decode(data)
+
+    def put(self, key: bytes, embedding: List[float]) -> List[float]:
+        """
+        Store an embedding in the memory tier and, if enabled, on disk.
+        Returns the stored vector as later hits will see it, so a key always
+        yields the same float32 (or dequantized int8) values.
+        """
+        data = self._encode(embedding)
+        self._store(key, data)
+        if self._disk is not None:
+            self._disk.set(key, data)
+        return self._decode(data)
+
+    def get_or_compute(self, key: bytes, compute: Callable[[], List[float]]) -> List[float]:
+        """
+        Return the cached embedding for a key, computing and storing it on a miss.
+        """
+        embedding = self.get(key)
+        if embedding is not None:
+            logger.debug("Embedding cache hit.")
+            return embedding
+        return self.put(key, compute())
+
+    def _encode(self, embedding: List[float]) -> bytes:
+        """
+        Pack an embedding as float32, or as int8 scaled by its largest magnitude.
+        """
+        if not self.quantize:
+            return _FLOAT32_TAG + array('f', embedding).tobytes()
+        scale = max(map(abs, embedding), default=0.0) / 127 or 1.0
+        quantized = array('b', (round(value / scale) for value in embedding))
+        return _INT8_TAG + struct.pack('f', scale) + quantized.tobytes()
+
+    @staticmethod
+    def _decode(data: bytes) -> List[float]:
+        """
+        Unpack a stored embedding into a list of floats.
+        """
+        if data[:1] == _INT8_TAG:
+            scale = struct.unpack_from('f', data, 1)[0]
+            return [value * scale for value in memoryview(data)[5:].cast('b')]
+        return memoryview(data)[1:].cast('f').tolist()
+
+    def _store(self, key: bytes, data: bytes) -> None:
+        """
+        Insert a vector in the memory tier, evicting the least recently used entries.
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
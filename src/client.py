@@ -1,23 +1,68 @@
 # client.py
 
-import sys
-import json
+from __future__ import annotations
+
+import heapq
+import itertools
 import time
-from typing import Any, Dict, List, Tuple
-from pymongo import MongoClient
-from pymongo.collection import Collection
-from pymongo.database import Database
-import openai
+from concurrent.futures import ThreadPoolExecutor, wait
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, Union
+from bson import json_util
+from bson.binary import Binary, BinaryVectorDtype
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, wait_exponential
 import logging
 
+from cache import EmbeddingCache, normalize_text
 from config import Config
 
-# Configure logging for the client module
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s %(levelname)s:%(message)s')
+# pymongo and openai are imported when the clients are created, keeping imports fast
+if TYPE_CHECKING:
+    import openai
+    from pymongo import MongoClient
+    from pymongo.collection import Collection
+
 logger = logging.getLogger(__name__)
 
 
+class HybridSearchError(Exception):
+    """
+    Base class for errors raised by the hybrid search client.
+    """
+
+
+class SetupError(HybridSearchError):
+    """
+    Raised when MongoDB cannot be reached or the collection and indexes are not set up.
+    """
+
+
+class EmbeddingError(HybridSearchError):
+    """
+    Raised when an embedding cannot be generated with the OpenAI API.
+    """
+
+
+class SearchError(HybridSearchError):
+    """
+    Raised when an aggregation pipeline fails to execute.
+    """
+
+
+def _retrying(*exception_types: type) -> Retrying:
+    """
+    Build a retry policy with exponential backoff for transient errors of the given types.
+    """
+    return Retrying(
+        retry=retry_if_exception_type(exception_types),
+        wait=wait_exponential(multiplier=0.1, max=2),
+        stop=stop_after_attempt(4),
+        reraise=True
+    )
+
+
 def check_collection(client: MongoClient, db_name: str, coll_name: str) -> None:
     """
     Check if the specified collection exists in the database.
@@ -27,10 +72,10 @@ def check_collection(client: MongoClient, db_name: str, coll_name: str) -> None:
         if coll_name not in collections:
             raise Exception(
                 f"Collection '{coll_name}' not found in database '{db_name}'.")
-        logger.info(f"Collection '{coll_name}' found in database '{db_name}'.")
+        logger.info("Collection '%s' found in database '%s'.", coll_name, db_name)
     except Exception as e:
-        logger.error(f"Error checking collection: {e}")
-        sys.exit(1)
+        logger.error("Error checking collection: %s", e)
+        raise SetupError(f"Error checking collection: {e}") from e
 
 
 def check_index(client: MongoClient, db_name: str, coll_name: str, index_name: str) -> None:
@@ -43,10 +88,36 @@ def check_index(client: MongoClient, db_name: str, coll_name: str, index_name: s
         if not indexes:
             raise Exception(
                 f"Index '{index_name}' not found in collection '{coll_name}'.")
-        logger.info(f"Index '{index_name}' found in collection '{coll_name}'.")
+        logger.info("Index '%s' found in collection '%s'.", index_name, coll_name)
+    except Exception as e:
+        logger.error("Error checking index: %s", e)
+        raise SetupError(f"Error checking index: {e}") from e
+
+
+def check_vector_dimensions(
+    client: MongoClient,
+    db_name: str,
+    coll_name: str,
+    index_name: str,
+    path: str,
+    dimensions: int
+) -> None:
+    """
+    Check that the vector index on the given path expects embeddings of the given size.
+    """
+    try:
+        collection = client[db_name][coll_name]
+        for index in collection.list_search_indexes(index_name):
+            definition = index.get('latestDefinition', {})
+            for field in definition.get('fields', []):
+                if field.get('path') == path and field.get('numDimensions') != dimensions:
+                    raise Exception(
+                        f"Index '{index_name}' expects {field.get('numDimensions')} dimensions "
+                        f"on '{path}', but embeddings have {dimensions}.")
+        logger.info("Index '%s' matches the embedding size.", index_name)
     except Exception as e:
-        logger.error(f"Error checking index: {e}")
-        sys.exit(1)
+        logger.error("Error checking vector dimensions: %s", e)
+        raise SetupError(f"Error checking vector dimensions: {e}") from e
 
 
 class HybridSearchClient:
@@ -54,60 +125,201 @@ class HybridSearchClient:
     Client class to perform hybrid search (vector and text) on MongoDB using OpenAI embeddings.
     """
 
+    # Reciprocal rank fusion constant, as in MongoDB's RRF tutorial
+    RRF_K = 60
+    # Number of documents ranked by each search branch
+    BRANCH_LIMIT = 20
+
     def __init__(self, config: Config):
         self.config = config
-        self.client = self._initialize_mongo_client()
+        # Set up everything that can fail on its own before opening MongoDB connections
         self.oai_client = self._initialize_openai()
+        self.embedding_cache = self._initialize_embedding_cache()
+        self.client = self._initialize_mongo_client()
+        self.collection: Collection = self.client[self.config.DB_NAME][self.config.COLLECTION_NAME]
+        # Search branch results are decoded lazily; only the fields read during fusion are touched
+        self._raw_collection: Collection = self.collection.with_options(
+            codec_options=CodecOptions(document_class=RawBSONDocument))
+        self._vector_template, self._text_template = self._build_pipeline_templates()
+        self._pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix='hybrid')
+
+    def __enter__(self) -> HybridSearchClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut down the branch thread pool and close the MongoDB connections.
+        """
+        self._pool.shutdown()
+        self.client.close()
+        logger.info("Hybrid search client closed.")
 
     def _initialize_mongo_client(self) -> MongoClient:
         """
         Initialize MongoDB client and connect to the cluster.
+        A ping forces the handshake so the first search does not pay for it.
         """
+        from pymongo import MongoClient
+
+        client: Optional[MongoClient] = None
         try:
-            client = MongoClient(self.config.ATLAS_CONNECTION_STRING)
+            client = MongoClient(
+                self.config.ATLAS_CONNECTION_STRING,
+                maxPoolSize=self.config.MAX_POOL_SIZE,
+                minPoolSize=self.config.MIN_POOL_SIZE,
+                serverSelectionTimeoutMS=self.config.SERVER_SELECTION_TIMEOUT_MS
+            )
+            client.admin.command('ping')
             logger.info("Connected to MongoDB Atlas.")
             return client
         except Exception as e:
-            logger.error(f"Failed to connect to MongoDB: {e}")
-            sys.exit(1)
+            logger.error("Failed to connect to MongoDB: %s", e)
+            # Release the monitor thread and pool so retrying construction does not leak them
+            if client is not None:
+                client.close()
+            raise SetupError(f"Failed to connect to MongoDB: {e}") from e
 
     def _initialize_openai(self) -> openai.OpenAI:
         """
         Initialize OpenAI API with the provided API key.
+        The SDK's own retries are disabled; transient errors are retried with backoff
+        in `_create_embeddings`.
         """
-        return openai.OpenAI(api_key=self.config.OPENAI_API_KEY)
+        import openai
+
+        return openai.OpenAI(api_key=self.config.OPENAI_API_KEY, max_retries=0)
+
+    def _initialize_embedding_cache(self) -> EmbeddingCache:
+        """
+        Initialize the embedding cache, opening the on-disk tier when configured.
+        """
+        try:
+            return EmbeddingCache(
+                self.config.EMBED_CACHE_SIZE,
+                self.config.EMBED_CACHE_PATH or None,
+                self.config.EMBED_CACHE_QUANTIZE,
+                self.config.EMBED_CACHE_FUZZY
+            )
+        except ImportError as e:
+            logger.error("Failed to initialize embedding cache: %s", e)
+            raise SetupError(f"Failed to initialize embedding cache: {e}") from e
 
     def validate_setup(self) -> None:
         """
         Validate that the specified collection and indexes exist in MongoDB.
+        Raises SetupError if any check fails.
         """
-        try:
-            check_collection(self.client, self.config.DB_NAME,
-                             self.config.COLLECTION_NAME)
-            check_index(self.client, self.config.DB_NAME,
-                        self.config.COLLECTION_NAME, self.config.VECTOR_INDEX_NAME)
-            check_index(self.client, self.config.DB_NAME,
-                        self.config.COLLECTION_NAME, self.config.TEXT_INDEX_NAME)
-            logger.info(
-                "MongoDB collection and indexes validated successfully.")
-        except Exception as e:
-            logger.error(f"Validation error: {e}")
-            sys.exit(1)
+        check_collection(self.client, self.config.DB_NAME,
+                         self.config.COLLECTION_NAME)
+        check_index(self.client, self.config.DB_NAME,
+                    self.config.COLLECTION_NAME, self.config.VECTOR_INDEX_NAME)
+        check_index(self.client, self.config.DB_NAME,
+                    self.config.COLLECTION_NAME, self.config.TEXT_INDEX_NAME)
+        dimensions = self._dimensions(self.config.EMBED_MODEL)
+        if dimensions:
+            check_vector_dimensions(self.client, self.config.DB_NAME,
+                                    self.config.COLLECTION_NAME, self.config.VECTOR_INDEX_NAME,
+                                    self.config.VECTOR_FIELD, dimensions)
+        logger.info(
+            "MongoDB collection and indexes validated successfully.")
 
-    def get_embedding(self, text: str, model: str = "text-embedding-ada-002") -> List[float]:
+    def _dimensions(self, model: str) -> Optional[int]:
+        """
+        Return the embedding size to request, or None for models with a fixed size.
+        Only the text-embedding-3 family accepts the `dimensions` parameter.
+        """
+        if model.startswith("text-embedding-3") and self.config.EMBED_DIM:
+            return self.config.EMBED_DIM
+        return None
+
+    def _cache_model(self, model: str) -> str:
+        """
+        Return the model identifier used in cache keys, including the embedding size.
+        """
+        dimensions = self._dimensions(model)
+        return f"{model}:{dimensions}" if dimensions else model
+
+    def get_embedding(self, text: str, model: Optional[str] = None) -> List[float]:
         """
         Generate a vector embedding for a given text using OpenAI API.
+        Embeddings are served from the cache when the text was seen before.
+        """
+        model = model or self.config.EMBED_MODEL
+        text = normalize_text(text)
+        key = self.embedding_cache.make_key(self._cache_model(model), text)
+        return self.embedding_cache.get_or_compute(
+            key, lambda: self._create_embedding(text, model))
+
+    def get_embeddings(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        batch_size: int = 512
+    ) -> List[List[float]]:
         """
-        text = text.replace("\n", " ")
+        Generate vector embeddings for many texts, preserving their order.
+        Cached texts are skipped and the remaining ones are sent to the OpenAI API
+        in batches of `batch_size` inputs per request.
+        """
+        model = model or self.config.EMBED_MODEL
+        cache_model = self._cache_model(model)
+        texts = [normalize_text(text) for text in texts]
+        keys = [self.embedding_cache.make_key(cache_model, text) for text in texts]
+        embeddings: List[Optional[List[float]]] = [
+            self.embedding_cache.get(key) for key in keys]
+
+        # Group cache misses by key so duplicate texts are embedded only once
+        missing: Dict[bytes, List[int]] = {}
+        for idx, embedding in enumerate(embeddings):
+            if embedding is None:
+                missing.setdefault(keys[idx], []).append(idx)
+        missing_keys = list(missing)
+        logger.debug("Embedding cache misses: %d/%d",
+                     sum(map(len, missing.values())), len(texts))
+
+        for start in range(0, len(missing_keys), batch_size):
+            chunk_keys = missing_keys[start:start + batch_size]
+            chunk = [texts[missing[key][0]] for key in chunk_keys]
+            for key, embedding in zip(chunk_keys, self._create_embeddings(chunk, model)):
+                embedding = self.embedding_cache.put(key, embedding)
+                for idx in missing[key]:
+                    embeddings[idx] = embedding
+
+        return embeddings
+
+    def _create_embedding(self, text: str, model: str) -> List[float]:
+        """
+        Request a single embedding from the OpenAI API.
+        """
+        return self._create_embeddings([text], model)[0]
+
+    def _create_embeddings(self, texts: List[str], model: str) -> List[List[float]]:
+        """
+        Request embeddings for a batch of texts from the OpenAI API in a single call.
+        Rate limits, connection errors and server errors are retried with backoff;
+        EmbeddingError is raised once retries are exhausted or on any other error.
+        """
+        import openai
+
+        dimensions = self._dimensions(model)
+        options: Dict[str, Any] = {'dimensions': dimensions} if dimensions else {}
         try:
-            response = self.oai_client.embeddings.create(
-                input=[text], model=model)
-            embedding = response.data[0].embedding
-            logger.debug(f"Generated embedding for text: {text}")
-            return embedding
+            for attempt in _retrying(openai.RateLimitError, openai.APIConnectionError,
+                                     openai.InternalServerError):
+                with attempt:
+                    response = self.oai_client.embeddings.create(
+                        input=texts, model=model, **options)
+            embeddings = [d.embedding for d in sorted(
+                response.data, key=lambda d: d.index)]
+            logger.debug("Generated %d embedding(s).", len(embeddings))
+            return embeddings
         except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
-            sys.exit(1)
+            logger.error("OpenAI API error: %s", e)
+            raise EmbeddingError(f"OpenAI API error: {e}") from e
 
     def set_pipeline_indices(
         self,
@@ -117,209 +329,270 @@ class HybridSearchClient:
         collection_name: str
     ) -> List[Dict[str, Any]]:
         """
-        Recursively set the appropriate vector and text index names in the aggregation pipeline.
-        """
-        updated_pipeline = []
-        for stage in pipeline:
-            if '$vectorSearch' in stage:
-                stage['$vectorSearch']['index'] = vector_index
-                updated_pipeline.append(stage)
-                logger.debug(f"Set '$vectorSearch' index to '{vector_index}'.")
-            elif '$search' in stage:
-                stage['$search']['index'] = text_index
-                updated_pipeline.append(stage)
-                logger.debug(f"Set '$search' index to '{text_index}'.")
-            elif '$unionWith' in stage:
-                stage['$unionWith']['coll'] = collection_name
-                stage['$unionWith']['pipeline'] = self.set_pipeline_indices(
-                    stage['$unionWith']['pipeline'],
-                    vector_index,
-                    text_index,
-                    collection_name
-                )
-                updated_pipeline.append(stage)
-                logger.debug(
-                    f"Set '$unionWith' collection to '{collection_name}'.")
-            else:
-                updated_pipeline.append(stage)
-        return updated_pipeline
+        Set the appropriate vector and text index names in the aggregation pipeline.
+        Stages are updated in place, descending only into `$unionWith` sub-pipelines.
+        """
+        pending = [pipeline]
+        while pending:
+            for stage in pending.pop():
+                if '$vectorSearch' in stage:
+                    stage['$vectorSearch']['index'] = vector_index
+                elif '$search' in stage:
+                    stage['$search']['index'] = text_index
+                elif '$unionWith' in stage:
+                    stage['$unionWith']['coll'] = collection_name
+                    pending.append(stage['$unionWith']['pipeline'])
+        return pipeline
 
     def execute_query(
         self,
         db_name: str,
         coll_name: str,
-        pipeline: List[Dict[str, Any]]
+        pipeline: List[Dict[str, Any]],
+        limit: Optional[int] = None
     ) -> Tuple[List[Dict[str, Any]], float]:
         """
         Execute the aggregation pipeline and return results along with execution time.
+        Results are fetched in batches of `Config.BATCH_SIZE` documents with disk use
+        allowed for blocking stages, and iteration stops after `limit` documents when
+        one is given.
+        Dropped connections are retried with backoff; SearchError is raised once retries
+        are exhausted or on any other error.
+        """
+        if (db_name, coll_name) == (self.config.DB_NAME, self.config.COLLECTION_NAME):
+            collection: Collection = self.collection
+        else:
+            collection = self.client[db_name][coll_name]
+        return self._aggregate(collection, pipeline, limit)
+
+    def _aggregate(
+        self,
+        collection: Collection,
+        pipeline: List[Dict[str, Any]],
+        limit: Optional[int] = None
+    ) -> Tuple[List[Mapping[str, Any]], float]:
         """
-        collection: Collection = self.client[db_name][coll_name]
+        Run an aggregation on a collection, returning documents of its codec's document class.
+        """
+        from pymongo.errors import AutoReconnect
+
         start_time: float = time.time()
         try:
-            results = list(collection.aggregate(pipeline))
+            for attempt in _retrying(AutoReconnect):
+                with attempt:
+                    with collection.aggregate(pipeline, batchSize=self.config.BATCH_SIZE,
+                                              allowDiskUse=True) as cursor:
+                        results = list(itertools.islice(cursor, limit))
             logger.info("Aggregation pipeline executed successfully.")
         except Exception as e:
-            logger.error(f"Error executing pipeline: {e}")
-            sys.exit(1)
+            logger.error("Error executing pipeline: %s", e)
+            raise SearchError(f"Error executing pipeline: {e}") from e
         elapsed_time: float = time.time() - start_time
-        logger.info(f"Pipeline execution time: {elapsed_time:.2f} seconds.")
+        logger.info("Pipeline execution time: %.2f seconds.", elapsed_time)
         return results, elapsed_time
 
-    def hybrid_search(self, query_text: str) -> Tuple[List[Dict[str, Any]], float]:
+    def _build_pipeline_templates(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
-        Perform a hybrid search combining vector and text search.
+        Build both search branches once, with their indices set and the query slots empty.
+        """
+        vector_template = self.set_pipeline_indices(
+            self._build_vector_pipeline(),
+            self.config.VECTOR_INDEX_NAME,
+            self.config.TEXT_INDEX_NAME,
+            self.config.COLLECTION_NAME
+        )
+        text_template = self.set_pipeline_indices(
+            self._build_text_pipeline(),
+            self.config.VECTOR_INDEX_NAME,
+            self.config.TEXT_INDEX_NAME,
+            self.config.COLLECTION_NAME
+        )
+        return vector_template, text_template
+
+    def _vector_pipeline(self, query_vector: Union[List[float], Binary]) -> List[Dict[str, Any]]:
+        """
+        Return the vector search branch for a query vector.
+        Only the first stage is copied; the remaining stages are shared with the template.
+        """
+        pipeline = list(self._vector_template)
+        vector_search = pipeline[0]['$vectorSearch']
+        pipeline[0] = {
+            '$vectorSearch': {**vector_search, 'queryVector': query_vector}}
+        return pipeline
+
+    def _text_pipeline(self, query_text: str) -> List[Dict[str, Any]]:
+        """
+        Return the full-text search branch for a query text.
+        Only the first stage is copied; the remaining stages are shared with the template.
         """
-        # Generate query vector
-        query_vector: List[float] = self.get_embedding(query_text)
+        pipeline = list(self._text_template)
+        search = pipeline[0]['$search']
+        pipeline[0] = {
+            '$search': {**search, 'text': {**search['text'], 'query': query_text}}}
+        return pipeline
 
-        # Define the vector search pipeline
-        vector_search_pipeline: List[Dict[str, Any]] = [
+    def _build_vector_pipeline(self) -> List[Dict[str, Any]]:
+        """
+        Build the vector search branch, ranking documents by vector similarity.
+        """
+        return [
             {
                 '$vectorSearch': {
                     'path': self.config.VECTOR_FIELD,
-                    'queryVector': query_vector,
+                    'queryVector': None,
                     'numCandidates': 100,
-                    'limit': 20
-                }
-            },
-            {
-                '$group': {
-                    '_id': None,
-                    'docs': {'$push': '$$ROOT'}
+                    'limit': self.BRANCH_LIMIT
                 }
             },
             {
-                '$unwind': {
-                    'path': '$docs',
-                    'includeArrayIndex': 'rank'
+                # Drop every other field, including the embedding, before ranking
+                '$project': {
+                    f'{self.config.TEXT_FIELD}': 1,
+                    'search_score': {'$meta': 'vectorSearchScore'}
                 }
             },
             {
-                '$addFields': {
-                    'vs_score': {
-                        '$multiply': [
-                            self.config.VECTOR_WEIGHT,
-                            {
-                                '$divide': [
-                                    1.0,
-                                    {'$add': ['$rank', 60]}
-                                ]
-                            }
-                        ]
+                '$setWindowFields': {
+                    'sortBy': {'search_score': -1},
+                    'output': {
+                        'rank': {'$documentNumber': {}}
                     }
                 }
             },
             {
                 '$project': {
-                    'vs_score': 1,
-                    '_id': '$docs._id',
-                    f'{self.config.TEXT_FIELD}': f'$docs.{self.config.TEXT_FIELD}'
+                    'rank': 1,
+                    '_id': 1,
+                    f'{self.config.TEXT_FIELD}': 1
                 }
             }
         ]
 
-        # Define the text search pipeline
-        text_search_pipeline: List[Dict[str, Any]] = [
+    def _build_text_pipeline(self) -> List[Dict[str, Any]]:
+        """
+        Build the full-text search branch, ranking documents by text relevance.
+        """
+        return [
             {
                 '$search': {
                     'index': self.config.TEXT_INDEX_NAME,
                     'text': {
-                        'query': query_text,
+                        'query': None,
                         'path': self.config.TEXT_FIELD
                     }
                 }
             },
             {
-                '$limit': 20
-            },
-            {
-                '$group': {
-                    '_id': None,
-                    'docs': {'$push': '$$ROOT'}
-                }
-            },
-            {
-                '$unwind': {
-                    'path': '$docs',
-                    'includeArrayIndex': 'rank'
-                }
-            },
-            {
-                '$addFields': {
-                    'fts_score': {
-                        '$multiply': [
-                            self.config.TEXT_WEIGHT,
-                            {
-                                '$divide': [
-                                    1.0,
-                                    {'$add': ['$rank', 60]}
-                                ]
-                            }
-                        ]
-                    }
-                }
+                '$limit': self.BRANCH_LIMIT
             },
             {
+                # Drop every other field, including the embedding, before ranking
                 '$project': {
-                    'fts_score': 1,
-                    '_id': '$docs._id',
-                    f'{self.config.TEXT_FIELD}': f'$docs.{self.config.TEXT_FIELD}'
-                }
-            }
-        ]
-
-        # Combine pipelines using $unionWith
-        combined_pipeline: List[Dict[str, Any]] = vector_search_pipeline + [
-            {
-                '$unionWith': {
-                    'coll': self.config.COLLECTION_NAME,
-                    'pipeline': text_search_pipeline
-                }
-            },
-            {
-                '$group': {
-                    '_id': f'${self.config.TEXT_FIELD}',
-                    'vs_score': {'$max': '$vs_score'},
-                    'fts_score': {'$max': '$fts_score'}
+                    f'{self.config.TEXT_FIELD}': 1,
+                    'search_score': {'$meta': 'searchScore'}
                 }
             },
             {
-                '$project': {
-                    '_id': 1,
-                    f'{self.config.TEXT_FIELD}': '$_id',
-                    'vs_score': {'$ifNull': ['$vs_score', 0]},
-                    'fts_score': {'$ifNull': ['$fts_score', 0]}
+                '$setWindowFields': {
+                    'sortBy': {'search_score': -1},
+                    'output': {
+                        'rank': {'$documentNumber': {}}
+                    }
                 }
             },
             {
                 '$project': {
-                    'score': {'$add': ['$vs_score', '$fts_score']},
+                    'rank': 1,
                     '_id': 1,
-                    f'{self.config.TEXT_FIELD}': 1,
-                    'vs_score': 1,
-                    'fts_score': 1
+                    f'{self.config.TEXT_FIELD}': 1
                 }
-            },
-            {'$sort': {'score': -1}},
-            {'$limit': 10}
+            }
         ]
 
-        # Adjust pipeline indices
-        updated_pipeline: List[Dict[str, Any]] = self.set_pipeline_indices(
-            combined_pipeline,
-            self.config.VECTOR_INDEX_NAME,
-            self.config.TEXT_INDEX_NAME,
-            self.config.COLLECTION_NAME
+    def _fuse_results(
+        self,
+        vector_results: List[Mapping[str, Any]],
+        text_results: List[Mapping[str, Any]],
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Merge both branches by text, summing their weighted reciprocal rank scores.
+        Branch ranks are 1-based, so the top document of a branch scores weight / RRF_K.
+        """
+        text_field = self.config.TEXT_FIELD
+        fused: Dict[Any, Dict[str, Any]] = {}
+        branches = (
+            (vector_results, 'vs_score', self.config.VECTOR_WEIGHT),
+            (text_results, 'fts_score', self.config.TEXT_WEIGHT)
         )
+        for docs, score_field, weight in branches:
+            for doc in docs:
+                text = doc.get(text_field)
+                entry = fused.setdefault(text, {
+                    '_id': text,
+                    text_field: text,
+                    'vs_score': 0,
+                    'fts_score': 0
+                })
+                score = weight / (doc['rank'] - 1 + self.RRF_K)
+                entry[score_field] = max(entry[score_field], score)
 
-        logger.debug(
-            f"Updated Aggregation Pipeline: {json.dumps(updated_pipeline, indent=2)}")
+        for entry in fused.values():
+            entry['score'] = entry['vs_score'] + entry['fts_score']
+        return heapq.nlargest(limit, fused.values(), key=itemgetter('score'))
 
-        # Execute the query
-        results, elapsed_time = self.execute_query(
-            self.config.DB_NAME,
-            self.config.COLLECTION_NAME,
-            updated_pipeline
+    def hybrid_search(self, query_text: str) -> Tuple[List[Dict[str, Any]], float]:
+        """
+        Perform a hybrid search combining vector and text search.
+        The text branch does not depend on the query vector, so it starts right away
+        and overlaps with the embedding request; results are fused client-side with RRF.
+        Raises EmbeddingError or SearchError if either step fails after retries.
+        """
+        start_time: float = time.time()
+        # Start the text search branch
+        text_pipeline: List[Dict[str, Any]] = self._text_pipeline(
+            query_text)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Text Search Pipeline: %s",
+                         json_util.dumps(text_pipeline, indent=2))
+        text_future = self._pool.submit(
+            self._aggregate,
+            self._raw_collection,
+            text_pipeline,
+            self.BRANCH_LIMIT
         )
 
+        try:
+            # Generate query vector while the text search is in flight
+            query_vector: Union[List[float], Binary] = self.get_embedding(query_text)
+            if self.config.BINARY_QUERY_VECTOR:
+                # Packed float32 is about half the size of a BSON array of doubles
+                query_vector = Binary.from_vector(
+                    query_vector, BinaryVectorDtype.FLOAT32)
+
+            # Start the vector search branch
+            vector_pipeline: List[Dict[str, Any]] = self._vector_pipeline(
+                query_vector)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Vector Search Pipeline: %s",
+                             json_util.dumps(vector_pipeline, indent=2))
+            vector_future = self._pool.submit(
+                self._aggregate,
+                self._raw_collection,
+                vector_pipeline,
+                self.BRANCH_LIMIT
+            )
+
+            vector_results, _ = vector_future.result()
+        except BaseException:
+            # Do not leave the text branch running unobserved on a busy worker
+            if not text_future.cancel():
+                wait([text_future])
+            raise
+        text_results, _ = text_future.result()
+
+        results = self._fuse_results(vector_results, text_results)
+        elapsed_time: float = time.time() - start_time
+        logger.info("Hybrid search execution time: %.2f seconds.", elapsed_time)
+
         return results, elapsed_time
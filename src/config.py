@@ -6,9 +6,6 @@ from dotenv import load_dotenv
 from typing import List
 import logging
 
-# Configure logging for the configuration module
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s %(levelname)s:%(message)s')
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +23,17 @@ class Config:
     TEXT_FIELD: str
     VECTOR_WEIGHT: float
     TEXT_WEIGHT: float
+    EMBED_MODEL: str
+    EMBED_DIM: int
+    BINARY_QUERY_VECTOR: bool
+    EMBED_CACHE_SIZE: int
+    EMBED_CACHE_PATH: str
+    EMBED_CACHE_QUANTIZE: bool
+    EMBED_CACHE_FUZZY: bool
+    BATCH_SIZE: int
+    MAX_POOL_SIZE: int
+    MIN_POOL_SIZE: int
+    SERVER_SELECTION_TIMEOUT_MS: int
 
     def __init__(self):
         load_dotenv()
@@ -41,6 +49,21 @@ class Config:
         self.TEXT_FIELD = os.getenv('TEXT_FIELD', 'text')
         self.VECTOR_WEIGHT = float(os.getenv('VECTOR_WEIGHT', '0.5'))
         self.TEXT_WEIGHT = float(os.getenv('TEXT_WEIGHT', '0.5'))
+        self.EMBED_MODEL = os.getenv('EMBED_MODEL', 'text-embedding-3-small')
+        self.EMBED_DIM = int(os.getenv('EMBED_DIM', '512'))
+        self.BINARY_QUERY_VECTOR = os.getenv(
+            'BINARY_QUERY_VECTOR', 'false').lower() == 'true'
+        self.EMBED_CACHE_SIZE = int(os.getenv('EMBED_CACHE_SIZE', '1024'))
+        self.EMBED_CACHE_PATH = os.getenv('EMBED_CACHE_PATH', '')
+        self.EMBED_CACHE_QUANTIZE = os.getenv(
+            'EMBED_CACHE_QUANTIZE', 'false').lower() == 'true'
+        self.EMBED_CACHE_FUZZY = os.getenv(
+            'EMBED_CACHE_FUZZY', 'false').lower() == 'true'
+        self.BATCH_SIZE = int(os.getenv('BATCH_SIZE', '101'))
+        self.MAX_POOL_SIZE = int(os.getenv('MAX_POOL_SIZE', '16'))
+        self.MIN_POOL_SIZE = int(os.getenv('MIN_POOL_SIZE', '4'))
+        self.SERVER_SELECTION_TIMEOUT_MS = int(
+            os.getenv('SERVER_SELECTION_TIMEOUT_MS', '3000'))
 
         # Validate required variables
         required_vars = [
@@ -51,14 +74,15 @@ class Config:
             'VECTOR_INDEX_NAME',
             'TEXT_INDEX_NAME',
             'VECTOR_FIELD',
-            'TEXT_FIELD'
+            'TEXT_FIELD',
+            'EMBED_MODEL'
         ]
 
         missing_vars: List[str] = [
             var for var in required_vars if not getattr(self, var)]
         if missing_vars:
             logger.error(
-                f"Missing environment variables: {', '.join(missing_vars)}")
+                "Missing environment variables: %s", ', '.join(missing_vars))
             sys.exit(1)
         else:
             logger.info(